@@ -1,10 +1,37 @@
-from exbee.exb_parser import EXB
-from exbee.trs_parser import TRS
+# Avoids importing typing at startup; type checkers treat this as typing.TYPE_CHECKING.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from exbee.exb_parser import EXB
+    from exbee.trs_parser import TRS
 
 __version__ = "2026.2.20.2"
+__all__ = ["EXB", "TRS"]
+
+# EXB and TRS are resolved on first access, so that `import exbee` does not
+# pull in lxml, loguru or pydantic before they are actually needed.
+_lazy_attributes = {
+    "EXB": "exbee.exb_parser",
+    "TRS": "exbee.trs_parser",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        import importlib
+
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__ + ["__version__", "main"])
 
 
 def main() -> None:
+    from exbee.trs_parser import TRS
+
     trs = TRS("/home/peter/exbee/exbee/tests/ROG-Dia-GSO-P0005-std.trs")
     for i in trs.contents_dump:
         print(i)
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, field_validator
+
+
+class Segment(BaseModel):
+    xmin: float
+    xmax: float
+    speaker: str
+    content: str
+
+    @field_validator("xmax")
+    @classmethod
+    def validate_xmax(cls, v, info):
+        if v <= info.data["xmin"]:
+            raise ValueError("xmax must be greater than xmin")
+        return v
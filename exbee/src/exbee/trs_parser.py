@@ -1,26 +1,29 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 from lxml import etree  # pyright: ignore[reportAttributeAccessIssue]
-from loguru import logger
-from pydantic import BaseModel, Field, field_validator
 
+if TYPE_CHECKING:
+    from exbee.segment import Segment
 
-class Segment(BaseModel):
-    xmin: float
-    xmax: float
-    speaker: str
-    content: str
 
-    @field_validator("xmax")
-    @classmethod
-    def validate_xmax(cls, v, info):
-        if v <= info.data["xmin"]:
-            raise ValueError("xmax must be greater than xmin")
-        return v
+def __getattr__(name: str):
+    # Segment is re-exported lazily, so that pydantic is only imported when
+    # strict validation is actually performed.
+    if name == "Segment":
+        import importlib
+
+        return importlib.import_module("exbee.segment").Segment
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class TRS:
-    def __init__(self, file: Path | str):
+    def __init__(self, file: Path | str, strict: bool = True):
+        """
+        :param Path | str file: TRS file to parse
+        :param bool strict: validate parsed segments with pydantic, defaults to True
+        """
         self.path = Path(file)
+        self.strict = strict
         self.doc = etree.fromstring(Path(file).read_bytes())
         self.speakers_raw = self.find_speakers_from_turns()
         self.speaker_table = {
@@ -162,8 +165,11 @@ class TRS:
 
     def postprocess_dump(self):
         results = self.contents_dump
-        for i in results:
-            Segment(**i)
+        if self.strict:
+            from exbee.segment import Segment
+
+            for i in results:
+                Segment(**i)
         speakers = set(d["speaker"] for d in results)
         new_results = dict()
         for i in results:
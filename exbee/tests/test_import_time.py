@@ -0,0 +1,101 @@
+"""Startup-time regression tests.
+
+Wall-clock import times are noisy, so these tests mainly check a
+deterministic stand-in: which heavy modules show up in `-X importtime`
+output for each entry point. The bare `import exbee` additionally gets a
+deliberately loose bound on its cumulative import time.
+"""
+
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+demo_file = list(Path(".").glob("**/ROG-Dia-GSO-P0005-std.trs"))[0]
+heavy_modules = {"lxml", "loguru", "pydantic"}
+# Generous enough for slow CI machines, but well below what importing
+# pydantic or lxml eagerly would cost.
+bare_import_budget_us = 100_000
+
+
+def import_times(code: str) -> dict[str, int]:
+    """Runs code in a fresh interpreter with `-X importtime` and returns the
+    cumulative import time of every module it imported.
+
+    :param str code: Python code to run
+    :return dict[str, int]: module name to cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def imported_modules(code: str) -> set[str]:
+    """Runs code in a fresh interpreter with `-X importtime` and returns the
+    top-level names of all modules it imported.
+
+    :param str code: Python code to run
+    :return set[str]: top-level package names that were imported
+    """
+    return {name.split(".")[0] for name in import_times(code)}
+
+
+def test_bare_import_is_light():
+    modules = imported_modules("import exbee")
+    assert "exbee" in modules
+    assert not modules & heavy_modules
+
+
+def test_bare_import_time_budget():
+    times = import_times("import exbee")
+    assert times["exbee"] < bare_import_budget_us
+
+
+def test_exb_does_not_import_pydantic():
+    modules = imported_modules("from exbee import EXB")
+    assert {"lxml", "loguru"} <= modules
+    assert "pydantic" not in modules
+
+
+def test_non_strict_trs_does_not_import_pydantic():
+    modules = imported_modules(
+        f"from exbee import TRS; TRS({str(demo_file)!r}, strict=False)"
+    )
+    assert "lxml" in modules
+    assert "pydantic" not in modules
+
+
+def test_strict_trs_imports_pydantic():
+    modules = imported_modules(f"from exbee import TRS; TRS({str(demo_file)!r})")
+    assert "pydantic" in modules
+
+
+def test_segment_rejects_non_positive_duration():
+    from exbee.trs_parser import Segment
+
+    with pytest.raises(ValidationError):
+        Segment(xmin=1, xmax=1, speaker="a", content="b")
+    with pytest.raises(ValidationError):
+        Segment(xmin=1, xmax=0, speaker="a", content="b")
+
+
+def test_segment_pickles():
+    from exbee.trs_parser import Segment
+
+    segment = Segment(xmin=0, xmax=1, speaker="a", content="b")
+    assert pickle.loads(pickle.dumps(segment)) == segment